@@ -12,12 +12,15 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import settings
 from .learning_path_generator import Resource
+from .llm_cache import get_llm_cache, prepare_cached_request
+from .shared_session import SharedSessionMixin
 
 logger = logging.getLogger(__name__)
 
-class AIProcessor:
-    def __init__(self):
-        self.session = None
+class AIProcessor(SharedSessionMixin):
+    def __init__(self, session: aiohttp.ClientSession = None):
+        self._init_session(session)
+        self.llm_cache = get_llm_cache()
         self.request_count = 0  # Track requests for rate limiting
         
         logger.info("AIProcessor initialized with OpenRouter integration")
@@ -37,12 +40,13 @@ class AIProcessor:
     async def _get_session(self):
         """Get or create aiohttp session"""
         if self.session is None:
-            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+            # Every request goes to OpenRouter, so keep a small keep-alive pool for that one host
+            connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=30)
             timeout = aiohttp.ClientTimeout(total=30)
             self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
         return self.session
     
-    async def _call_openrouter_api(self, messages: List[Dict], model: str = None, max_tokens: int = 150) -> str:
+    async def _call_openrouter_api(self, messages: List[Dict], model: str = None, max_tokens: int = 150, temperature: float = 0.7) -> str:
         """
         Call OpenRouter API with OpenAI-compatible format
         """
@@ -65,7 +69,7 @@ class AIProcessor:
                 "model": model,
                 "messages": messages,
                 "max_tokens": max_tokens,
-                "temperature": 0.7,
+                "temperature": temperature,
                 "stream": False
             }
             
@@ -96,13 +100,13 @@ class AIProcessor:
             
         return None
     
-    async def _try_multiple_models(self, messages: List[Dict], max_tokens: int = 150) -> str:
+    async def _try_multiple_models(self, messages: List[Dict], max_tokens: int = 150, temperature: float = 0.7) -> str:
         """
         Try multiple OpenRouter models as fallback
         """
         for model in settings.FALLBACK_MODELS:
             try:
-                result = await self._call_openrouter_api(messages, model, max_tokens)
+                result = await self._call_openrouter_api(messages, model, max_tokens, temperature)
                 if result:
                     logger.info(f"Successfully used fallback model: {model}")
                     return result
@@ -147,13 +151,21 @@ Topic: {topic}"""
                 }
             ]
             
+            temperature, cache_key, cached = prepare_cached_request(
+                self.llm_cache, ",".join(settings.FALLBACK_MODELS), messages, text=topic, namespace="search_queries"
+            )
+            if cached is not None:
+                return cached
+            
             # Try to get response from OpenRouter
-            response = await self._try_multiple_models(messages, max_tokens=200)
+            response = await self._try_multiple_models(messages, max_tokens=200, temperature=temperature)
             
             if response:
                 queries = self._extract_queries_from_text(response, topic)
                 if queries:
                     logger.info(f"Generated {len(queries)} queries using OpenRouter")
+                    if self.llm_cache:
+                        self.llm_cache.set(cache_key, queries, text=topic, namespace="search_queries")
                     return queries
                     
         except Exception as e:
@@ -420,6 +432,4 @@ Example: 3,1,5,2,4"""
     
     async def close(self):
         """Close the aiohttp session"""
-        if self.session:
-            await self.session.close()
-            self.session = None 
\ No newline at end of file
+        await self._close_session() 
\ No newline at end of file
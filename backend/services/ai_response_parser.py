@@ -14,11 +14,14 @@ class AIResponseParser:
     
     def __init__(self):
         logger.info("🔍 INITIALIZING AI RESPONSE PARSER")
+        # Per-category resource counts from the last parse, computed once while parsing
+        self.last_resource_counts: Dict[str, int] = {}
         logger.info("✅ AI Response Parser initialized successfully")
     
     def parse_json_response(self, generated_text: str, topic: str) -> Dict[str, List[Resource]]:
         """Parse JSON response from LLM into categorized Resource objects"""
         logger.info("🔬 Parsing AI response")
+        self.last_resource_counts = {}
         
         try:
             # Clean the response text - remove any markdown or extra formatting
@@ -31,7 +34,8 @@ class AIResponseParser:
             result = self._convert_to_resources(data, topic)
             
             if result:
-                total_resources = sum(len(resources) for resources in result.values())
+                self.last_resource_counts = {category: len(resources) for category, resources in result.items()}
+                total_resources = sum(self.last_resource_counts.values())
                 logger.info(f"✅ Parsed {total_resources} AI resources")
                 return result
             else:
@@ -42,7 +46,8 @@ class AIResponseParser:
             logger.warning("❌ JSON parsing failed, trying fallback extraction")
             fallback_result = self._extract_json_from_text(generated_text, topic)
             if fallback_result:
-                total_resources = sum(len(resources) for resources in fallback_result.values())
+                self.last_resource_counts = {category: len(resources) for category, resources in fallback_result.items()}
+                total_resources = sum(self.last_resource_counts.values())
                 logger.info(f"✅ Fallback extraction: {total_resources} resources")
                 return fallback_result
             else:
@@ -4,34 +4,63 @@ Content aggregator service for gathering learning resources from various sources
 import asyncio
 import aiohttp
 import logging
-from typing import List
+from typing import Dict, List
 from .learning_path_generator import Resource
 from .search_engines import LLMSearchEngine
 from .fallback_data import FallbackDataProvider
+from .shared_session import SharedSessionMixin
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_SEARCHES = 8
 
-class ContentAggregator:
+
+class ContentAggregator(SharedSessionMixin):
     """Main content aggregation service that coordinates resource gathering"""
     
-    def __init__(self):
-        self.session = None
-        self.llm_search = LLMSearchEngine()
+    def __init__(self, session: aiohttp.ClientSession = None):
+        self._init_session(session)
+        self.llm_search = LLMSearchEngine(session=session)
         self.fallback_provider = FallbackDataProvider()
+        # Caps concurrent outbound searches when callers fan out across topics/categories;
+        # created on first use so it binds to the running loop (Python < 3.10 binds
+        # asyncio primitives to the loop current at construction)
+        self._sem = None
+        # In-flight LLM searches by topic, so concurrent category getters share one;
+        # entries are removed as soon as the search finishes
+        self._search_tasks: Dict[str, asyncio.Task] = {}
         
     async def _get_session(self):
         """Get or create aiohttp session"""
         if self.session is None:
+            connector = aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300)
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
         return self.session
     
+    def _search_semaphore(self) -> asyncio.Semaphore:
+        """Return the outbound search semaphore, creating it inside the running loop"""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        return self._sem
+    
+    async def warmup(self, hosts: List[str]):
+        """Open pooled connections to the given hosts so later requests skip DNS and TLS setup"""
+        session = await self._get_session()
+        
+        async def _probe(host: str):
+            try:
+                async with self._search_semaphore(), session.head(f"https://{host}", timeout=aiohttp.ClientTimeout(total=5)):
+                    pass
+            except Exception as e:
+                logger.debug(f"Warmup request to {host} failed: {str(e)}")
+        
+        await asyncio.gather(*(_probe(host) for host in hosts))
+    
     async def close(self):
         """Close the aiohttp session and LLM search engine"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        self._search_tasks.clear()
+        await self._close_session()
         if self.llm_search:
             await self.llm_search.close()
     
@@ -47,8 +76,7 @@ class ContentAggregator:
             logger.info(f"Getting comprehensive resources for topic: {topic}")
             
             # Use the LLM search engine to get comprehensive resources
-            session = await self._get_session()
-            all_resources = await self.llm_search.search(topic, session)
+            all_resources = await self._search_topic(topic)
             
             # Categorize resources by type
             categorized = {
@@ -56,6 +84,7 @@ class ContentAggregator:
                 'blogs': [],
                 'youtube': [],
                 'free_courses': [],
+                'paid_courses': [],
             }
             
             for resource in all_resources:
@@ -86,7 +115,9 @@ class ContentAggregator:
                     # Default categorization
                     if 'free' in price or price == '':
                         categorized['free_courses'].append(converted_resource)
-            logger.info(f"Categorized resources: docs={len(categorized['docs'])}, blogs={len(categorized['blogs'])}, youtube={len(categorized['youtube'])}, free_courses={len(categorized['free_courses'])}")
+                    elif 'paid' in price:
+                        categorized['paid_courses'].append(converted_resource)
+            logger.info(f"Categorized resources: docs={len(categorized['docs'])}, blogs={len(categorized['blogs'])}, youtube={len(categorized['youtube'])}, free_courses={len(categorized['free_courses'])}, paid_courses={len(categorized['paid_courses'])}")
             
             return categorized
             
@@ -95,6 +126,29 @@ class ContentAggregator:
             # Fall back to individual methods if comprehensive search fails
             return await self._get_fallback_categorized_resources(topic, enhanced_queries)
     
+    async def _search_topic(self, topic: str) -> List[Dict]:
+        """Run the LLM search for a topic, joining an identical search already in flight"""
+        task = self._search_tasks.get(topic)
+        if task is None:
+            task = asyncio.ensure_future(self._bounded_search(topic))
+            self._search_tasks[topic] = task
+            # Results aren't reused once the search is done, so a degraded
+            # (fallback-only) result is never pinned for later callers
+            task.add_done_callback(lambda done: self._forget_search(topic, done))
+        # Shield so one cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(task)
+    
+    def _forget_search(self, topic: str, task: asyncio.Task):
+        """Drop a finished search unless a newer one already replaced it"""
+        if self._search_tasks.get(topic) is task:
+            del self._search_tasks[topic]
+    
+    async def _bounded_search(self, topic: str) -> List[Dict]:
+        """Run one LLM search under the outbound concurrency cap"""
+        session = await self._get_session()
+        async with self._search_semaphore():
+            return await self.llm_search.search(topic, session)
+    
     async def get_documentation(self, topic: str, enhanced_queries: List[str]) -> List[Resource]:
         """Get official documentation and guides"""
         try:
@@ -162,6 +216,23 @@ class ContentAggregator:
         except Exception as e:
             logger.error(f"Error getting free courses: {str(e)}")
             return self.fallback_provider.get_fallback_courses(topic, "free")
+    
+    async def get_paid_courses(self, topic: str, enhanced_queries: List[str]) -> List[Resource]:
+        """Get paid online courses"""
+        try:
+            # Try to get comprehensive resources first
+            all_resources = await self.get_all_resources(topic, enhanced_queries)
+            paid_courses = all_resources.get('paid_courses', [])
+            
+            if paid_courses:
+                return paid_courses[:5]
+            
+            # Fallback
+            return self.fallback_provider.get_fallback_courses(topic, "paid")
+            
+        except Exception as e:
+            logger.error(f"Error getting paid courses: {str(e)}")
+            return self.fallback_provider.get_fallback_courses(topic, "paid")
 
     async def _get_fallback_categorized_resources(self, topic: str, enhanced_queries: List[str]) -> dict:
         """Get fallback categorized resources when LLM search fails"""
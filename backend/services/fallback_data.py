@@ -1,18 +1,28 @@
 """
 Fallback and curated data for different topics when search engines fail
 """
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from urllib.parse import quote
 from .learning_path_generator import Resource
 
 
 class FallbackDataProvider:
-    """Provides fallback data when search engines are unavailable"""
+    """Provides fallback data when search engines are unavailable
+    
+    The data is static, so each lookup is built once and memoized as immutable
+    tuples; the public methods hand out fresh lists so callers may mutate them.
+    """
     
     @staticmethod
     def get_documentation_sources() -> Dict[str, List[Resource]]:
         """Get predefined documentation sources for common topics"""
-        return {
+        return {key: list(docs) for key, docs in FallbackDataProvider._documentation_sources().items()}
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _documentation_sources() -> Dict[str, Tuple[Resource, ...]]:
+        sources = {
             'react': [
                 Resource("React Official Documentation", "https://react.dev/", "The official React documentation", "React"),
                 Resource("React Tutorial", "https://react.dev/learn", "Interactive React tutorial", "React"),
@@ -40,10 +50,16 @@ class FallbackDataProvider:
                 Resource("Scala Book", "https://docs.scala-lang.org/scala3/book/introduction.html", "Scala 3 Book - comprehensive guide", "Scala"),
             ]
         }
+        return {key: tuple(docs) for key, docs in sources.items()}
     
     @staticmethod
     def get_fallback_blogs(topic: str) -> List[Resource]:
         """Get fallback blog resources when search fails"""
+        return list(FallbackDataProvider._fallback_blogs(topic))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _fallback_blogs(topic: str) -> Tuple[Resource, ...]:
         fallback_blogs = {
             'scala': [
                 Resource("Scala Official Blog", "https://www.scala-lang.org/blog/", "Official Scala blog with news and tutorials", "Scala Blog"),
@@ -63,16 +79,21 @@ class FallbackDataProvider:
         topic_lower = topic.lower()
         for key, blogs in fallback_blogs.items():
             if key in topic_lower or topic_lower in key:
-                return blogs
+                return tuple(blogs)
         
         # Generic fallback
-        return [
-            Resource(f"{topic.title()} Resources", f"https://github.com/topics/{topic.lower()}", f"GitHub repositories related to {topic}", "GitHub")
-        ]
+        return (
+            Resource(f"{topic.title()} Resources", f"https://github.com/topics/{topic.lower()}", f"GitHub repositories related to {topic}", "GitHub"),
+        )
     
     @staticmethod
     def get_fallback_youtube(topic: str) -> List[Resource]:
         """Get fallback YouTube resources when search fails"""
+        return list(FallbackDataProvider._fallback_youtube(topic))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _fallback_youtube(topic: str) -> Tuple[Resource, ...]:
         fallback_youtube = {
             'scala': [
                 Resource("Rock the JVM Scala Course", "https://www.youtube.com/watch?v=DzFt0YkZo8M", "Complete Scala programming course", "Rock the JVM"),
@@ -89,13 +110,18 @@ class FallbackDataProvider:
         topic_lower = topic.lower()
         for key, videos in fallback_youtube.items():
             if key in topic_lower or topic_lower in key:
-                return videos
+                return tuple(videos)
         
-        return []
+        return ()
     
     @staticmethod
     def get_fallback_courses(topic: str, course_type: str = "free") -> List[Resource]:
         """Get fallback course resources when search fails"""
+        return list(FallbackDataProvider._fallback_courses(topic, course_type))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _fallback_courses(topic: str, course_type: str) -> Tuple[Resource, ...]:
         fallback_courses = {
             'scala': [
                 Resource("Coursera Scala Course", "https://www.coursera.org/specializations/scala", "Functional Programming in Scala Specialization", "Coursera", "Free" if course_type == "free" else "$39-79/month"),
@@ -112,13 +138,18 @@ class FallbackDataProvider:
         topic_lower = topic.lower()
         for key, courses in fallback_courses.items():
             if key in topic_lower or topic_lower in key:
-                return courses
+                return tuple(courses)
         
-        return []
+        return ()
     
     @staticmethod
     def get_curated_search_results(query: str) -> List[Dict]:
         """Return curated search results based on query keywords when all search engines fail"""
+        return [dict(result) for result in FallbackDataProvider._curated_search_results(query)]
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _curated_search_results(query: str) -> Tuple[Dict, ...]:
         query_lower = query.lower()
         curated_results = []
         
@@ -170,4 +201,4 @@ class FallbackDataProvider:
                 {'title': 'Reddit Programming', 'url': f'https://www.reddit.com/search/?q={quote(query)}', 'description': 'Programming discussions and resources'},
             ]
         
-        return curated_results 
\ No newline at end of file
+        return tuple(curated_results)
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Deterministic response cache for LLM-backed calls.
+
+Only deterministic (temperature 0) requests get a cache key, so a cached entry
+always replays what the model would have returned anyway. Entries expire after
+24 hours. The cache is opt-in via MENTOR_MIND_LLM_CACHE=1 and is off by default,
+including under run_tests.py: enabling it switches the cached calls from
+temperature 0.7 to 0, which is not how production samples. It uses diskcache
+when installed so hits survive across processes (each test script runs in its
+own process), falling back to an in-memory store that only helps within one.
+
+With MENTOR_MIND_SEMANTIC_CACHE=1 and sentence-transformers installed, an
+exact-key miss also checks for an earlier request whose input text (the topic,
+not the whole templated prompt) embeds within cosine 0.92, within the same
+namespace.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+CACHE_DIR = ".llm_cache"
+SEMANTIC_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+DEFAULT_TEMPERATURE = 0.7  # sampling temperature used when the cache is off
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value store used by LLMCache"""
+
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        ...
+
+    def update(self, key: str, fn: Callable[[Optional[Any]], Any], ttl: int) -> None:
+        """Atomically replace the value at key with fn(current value)"""
+        ...
+
+
+class MemoryBackend:
+    """Process-local backend storing (expires_at, value) pairs"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def update(self, key: str, fn: Callable[[Optional[Any]], Any], ttl: int) -> None:
+        # Single process and no await in between, so get + set is already atomic
+        self.set(key, fn(self.get(key)), ttl)
+
+
+class DiskBackend:
+    """diskcache-backed store shared by every process using the same directory"""
+
+    def __init__(self, directory: str = CACHE_DIR):
+        self._cache = diskcache.Cache(directory)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._cache.set(key, value, expire=ttl)
+
+    def update(self, key: str, fn: Callable[[Optional[Any]], Any], ttl: int) -> None:
+        # The transaction serializes read-modify-write across processes
+        with self._cache.transact():
+            self._cache.set(key, fn(self._cache.get(key)), expire=ttl)
+
+
+class SemanticIndex:
+    """Embedding index mapping input text to exact cache keys.
+
+    A linear scan over normalized embeddings is enough for the few hundred
+    entries a test run produces. The index lives in the cache backend and is
+    re-read on every lookup and merged on every write, so processes sharing a
+    DiskBackend see (and don't overwrite) each other's entries; entries whose
+    cache key has expired are pruned on write.
+    """
+
+    INDEX_KEY = "semantic-index"
+
+    def __init__(self, backend: CacheBackend, ttl: int, model_name: str = SEMANTIC_MODEL,
+                 threshold: float = SEMANTIC_THRESHOLD):
+        self.backend = backend
+        self.ttl = ttl
+        self.threshold = threshold
+        self._model = SentenceTransformer(model_name)
+
+    def _entries(self) -> List[Tuple[str, Any, str]]:
+        """Current (namespace, embedding, exact cache key) entries"""
+        return self.backend.get(self.INDEX_KEY) or []
+
+    def _encode(self, text: str):
+        return self._model.encode(" ".join(text.lower().split()), normalize_embeddings=True)
+
+    def nearest(self, namespace: str, text: str) -> Optional[str]:
+        """Return the cache key of the most similar earlier text, if close enough"""
+        candidates = [(emb, key) for ns, emb, key in self._entries() if ns == namespace]
+        if not candidates:
+            return None
+        query = self._encode(text)
+        best_key, best_score = None, 0.0
+        for embedding, key in candidates:
+            score = float(np.dot(query, embedding))
+            if score > best_score:
+                best_key, best_score = key, score
+        if best_score >= self.threshold:
+            logger.debug(f"LLM semantic cache hit for '{text}' ({best_score:.2f})")
+            return best_key
+        return None
+
+    def add(self, namespace: str, text: str, key: str):
+        entry = (namespace, self._encode(text), key)
+
+        def merge(entries: Optional[List[Tuple[str, Any, str]]]) -> List[Tuple[str, Any, str]]:
+            live = [e for e in entries or [] if e[2] != key and self.backend.get(e[2]) is not None]
+            return live + [entry]
+
+        self.backend.update(self.INDEX_KEY, merge, self.ttl)
+
+
+class LLMCache:
+    """Get/set wrapper keyed by a SHA-256 of the request"""
+
+    def __init__(self, backend: CacheBackend, ttl: int = DEFAULT_TTL, semantic: Optional[SemanticIndex] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self.semantic = semantic
+
+    @staticmethod
+    def cache_key(model: str, messages: List[Dict], temperature: float, tools: Optional[List[Dict]] = None) -> Optional[str]:
+        """Hash a chat request, or return None when sampling makes it uncacheable"""
+        if temperature != 0:
+            return None
+        payload = json.dumps(
+            {"model": model, "messages": messages, "tools": tools},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str], text: Optional[str] = None, namespace: str = "default") -> Optional[Any]:
+        """Look up an exact key, then (if enabled) a semantically similar text"""
+        if key is None:
+            return None
+        value = self.backend.get(key)
+        if value is not None:
+            logger.debug(f"LLM cache hit: {key[:12]}")
+            return value
+        if self.semantic is not None and text:
+            similar_key = self.semantic.nearest(namespace, text)
+            if similar_key is not None:
+                return self.backend.get(similar_key)
+        return None
+
+    def set(self, key: Optional[str], value: Any, text: Optional[str] = None, namespace: str = "default"):
+        if key is None or value is None:
+            return
+        self.backend.set(key, value, self.ttl)
+        if self.semantic is not None and text:
+            self.semantic.add(namespace, text, key)
+
+
+def prepare_cached_request(cache: Optional[LLMCache], model: str, messages: List[Dict],
+                           text: Optional[str] = None,
+                           namespace: str = "default") -> Tuple[float, Optional[str], Optional[Any]]:
+    """Pick the sampling temperature for a request and look it up in the cache.
+
+    Returns (temperature, cache key, cached value). While caching is on, requests
+    decode at temperature 0 so a replayed answer is one the model would give
+    again; with cache None this is (DEFAULT_TEMPERATURE, None, None).
+    """
+    if cache is None:
+        return DEFAULT_TEMPERATURE, None, None
+    key = cache.cache_key(model, messages, 0)
+    return 0, key, cache.get(key, text=text, namespace=namespace)
+
+
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the process-wide cache, or None unless MENTOR_MIND_LLM_CACHE=1"""
+    global _llm_cache
+    if os.getenv("MENTOR_MIND_LLM_CACHE") != "1":
+        return None
+    if _llm_cache is None:
+        backend = DiskBackend() if diskcache is not None else MemoryBackend()
+        semantic = None
+        if os.getenv("MENTOR_MIND_SEMANTIC_CACHE") == "1":
+            if SentenceTransformer is not None:
+                semantic = SemanticIndex(backend, DEFAULT_TTL)
+            else:
+                logger.warning("MENTOR_MIND_SEMANTIC_CACHE=1 but sentence-transformers is not installed")
+        _llm_cache = LLMCache(backend, semantic=semantic)
+        logger.info(f"LLM cache enabled ({type(backend).__name__}, semantic={semantic is not None})")
+    return _llm_cache
@@ -12,15 +12,58 @@ import os
 # Add the parent directory to the path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import settings
+from .llm_cache import get_llm_cache, prepare_cached_request
+from .shared_session import SharedSessionMixin
 
 logger = logging.getLogger(__name__)
 
 
-class LLMSearchEngine:
+# Shared, persona-independent instructions. Kept first in every persona prompt
+# so the common prefix can be served from the provider's prefix cache.
+RESOURCE_PROMPT_INSTRUCTIONS = """When a student asks about a topic, provide a comprehensive list of learning resources including:
+
+1. **Documentation & Official Resources**
+   - Official documentation links
+   - API references
+   - Getting started guides
+
+2. **Interactive Learning**
+   - Online courses (both free and paid)
+   - Interactive tutorials
+   - Coding bootcamps
+
+3. **Video Content**
+   - YouTube channels
+   - Video course platforms
+   - Conference talks
+
+4. **Written Content**
+   - Technical blogs
+   - Articles and tutorials
+   - Books and ebooks
+
+5. **Practical Resources**
+   - GitHub repositories
+   - Code examples
+   - Practice platforms
+
+For each resource, provide:
+- Title
+- Platform/Source
+- Description (why it's valuable)
+- Difficulty level (Beginner/Intermediate/Advanced)
+- Whether it's free or paid
+
+Format your response as a structured list with clear categories. Be specific about actual resource names, popular platforms, and well-known creators in the field.
+"""
+
+
+class LLMSearchEngine(SharedSessionMixin):
     """OpenRouter-based search engine that generates comprehensive learning resources using persona-based prompting"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: aiohttp.ClientSession = None):
+        self._init_session(session)
+        self.llm_cache = get_llm_cache()
         
         # Learning resource personas for different types of content
         self.personas = {
@@ -72,7 +115,7 @@ class LLMSearchEngine:
                     llm_resources = []
                     for persona_name, persona_config in self.personas.items():
                         try:
-                            resources = await self._generate_resources_with_persona(query, persona_name, persona_config)
+                            resources = await self._generate_resources_with_persona(query, persona_name, persona_config, session)
                             if resources:
                                 llm_resources.extend(resources)
                                 logger.info(f"OpenRouter {persona_name} generated {len(resources)} additional resources")
@@ -110,35 +153,30 @@ class LLMSearchEngine:
                 }
             ]
     
-    async def _generate_resources_with_persona(self, query: str, persona_name: str, persona_config: Dict) -> List[Dict]:
+    async def _generate_resources_with_persona(self, query: str, persona_name: str, persona_config: Dict, session: aiohttp.ClientSession = None) -> List[Dict]:
         """Generate resources using a specific persona via OpenRouter"""
         try:
             if not settings.OPENROUTER_API_KEY:
                 logger.warning("OpenRouter API key not found, using fallback")
                 return self._generate_fallback_resources(query)
             
-            session = await self._get_session()
+            # Reuse the caller's (possibly pre-warmed) session when one is provided
+            session = session or await self._get_session()
             
-            # Create comprehensive prompt with persona
-            prompt = self._create_persona_prompt(query, persona_config)
+            # Create comprehensive prompt with persona (OpenAI-compatible chat format)
+            messages = self._create_persona_messages(query, persona_config)
             
-            # Use OpenAI-compatible chat format for OpenRouter
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"{persona_config['role']}. {persona_config['expertise']}. {persona_config['style']}"
-                },
-                {
-                    "role": "user", 
-                    "content": prompt
-                }
-            ]
+            temperature, cache_key, cached = prepare_cached_request(
+                self.llm_cache, settings.DEFAULT_MODEL, messages, text=query, namespace=persona_name
+            )
+            if cached is not None:
+                return cached
             
             payload = {
                 "model": settings.DEFAULT_MODEL,
                 "messages": messages,
                 "max_tokens": 800,
-                "temperature": 0.7,
+                "temperature": temperature,
                 "stream": False
             }
             
@@ -156,6 +194,8 @@ class LLMSearchEngine:
                     if 'choices' in result and len(result['choices']) > 0:
                         generated_text = result['choices'][0]['message']['content']
                         resources = self._parse_generated_resources(generated_text, persona_name)
+                        if self.llm_cache and resources:
+                            self.llm_cache.set(cache_key, resources, text=query, namespace=persona_name)
                         return resources
                 elif response.status == 429:
                     logger.warning("Rate limit exceeded for OpenRouter")
@@ -167,47 +207,24 @@ class LLMSearchEngine:
         
         return []
     
-    def _create_persona_prompt(self, query: str, persona_config: Dict) -> str:
-        """Create a comprehensive prompt with persona details"""
-        return f"""A student wants to learn about "{query}". Please provide a comprehensive list of learning resources including:
-
-1. **Documentation & Official Resources**
-   - Official documentation links
-   - API references
-   - Getting started guides
-
-2. **Interactive Learning**
-   - Online courses (both free and paid)
-   - Interactive tutorials
-   - Coding bootcamps
-
-3. **Video Content**
-   - YouTube channels
-   - Video course platforms
-   - Conference talks
-
-4. **Written Content**
-   - Technical blogs
-   - Articles and tutorials
-   - Books and ebooks
-
-5. **Practical Resources**
-   - GitHub repositories
-   - Code examples
-   - Practice platforms
-
-For each resource, provide:
-- Title
-- Platform/Source
-- Description (why it's valuable)
-- Difficulty level (Beginner/Intermediate/Advanced)
-- Whether it's free or paid
-
-Format your response as a structured list with clear categories. Be specific about actual resource names, popular platforms, and well-known creators in the field.
-
-Topic: {query}
-
-Resources:"""
+    def _create_persona_messages(self, query: str, persona_config: Dict) -> List[Dict]:
+        """Create chat messages for one persona.
+        
+        The instructions shared by every persona and topic come first and are
+        byte-identical across calls, so providers with prefix caching only
+        prefill the persona and topic suffix after the first request.
+        """
+        persona = f"{persona_config['role']}. {persona_config['expertise']}. {persona_config['style']}"
+        return [
+            {
+                "role": "system",
+                "content": f"{RESOURCE_PROMPT_INSTRUCTIONS}\n<persona>\n{persona}\n</persona>"
+            },
+            {
+                "role": "user",
+                "content": f'A student wants to learn about "{query}".\n\nTopic: {query}\n\nResources:'
+            }
+        ]
     
     def _parse_generated_resources(self, generated_text: str, persona_name: str) -> List[Dict]:
         """Parse the generated text into structured resources"""
@@ -564,8 +581,7 @@ Resources:"""
     
     async def close(self):
         """Clean up resources"""
-        if self.session:
-            await self.session.close()
+        await self._close_session()
 
 
 class SearchEngineManager:
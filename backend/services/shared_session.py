@@ -0,0 +1,50 @@
+"""
+Session ownership and process-wide instances for services built on aiohttp
+"""
+import aiohttp
+
+
+class SharedSessionMixin:
+    """Mixin for services that hold an aiohttp session.
+
+    A session passed to the constructor is shared with the caller, who remains
+    responsible for closing it; otherwise the service creates and closes its own.
+    shared() hands out one instance per class so repeated callers reuse one
+    connection pool. That instance is bound to the event loop it is first used
+    on; call close_shared() before that loop finishes.
+    """
+
+    def _init_session(self, session: aiohttp.ClientSession = None):
+        self.session = session
+        self._owns_session = session is None
+
+    async def _close_session(self):
+        """Close the session if this service created it, and forget it either way"""
+        if self.session:
+            if self._owns_session:
+                await self.session.close()
+            self.session = None
+
+    @classmethod
+    def shared(cls, session: aiohttp.ClientSession = None):
+        """Return the process-wide instance of this class, creating it on first use.
+
+        Raises ValueError if a session is passed that differs from the one the
+        existing instance already uses.
+        """
+        # Looked up on cls itself so subclasses never receive a parent's instance
+        instance = cls.__dict__.get("_shared")
+        if instance is None:
+            instance = cls(session=session)
+            cls._shared = instance
+        elif session is not None and session is not instance.session:
+            raise ValueError(f"{cls.__name__}.shared() already exists with a different session")
+        return instance
+
+    @classmethod
+    async def close_shared(cls):
+        """Close and forget the shared instance, if one was created"""
+        instance = cls.__dict__.get("_shared")
+        if instance is not None:
+            cls._shared = None
+            await instance.close()
@@ -0,0 +1,15 @@
+"""
+Shared pytest setup for the backend test scripts.
+
+Puts backend/ on sys.path once so test modules can ``from services import ...``.
+Nothing is imported eagerly here, so a missing backend dependency only fails
+the modules that need it instead of collection of the whole tree. Outside
+pytest the scripts add the path themselves when run directly.
+"""
+import sys
+from pathlib import Path
+
+# Resolved once here instead of in every test module, independent of the CWD
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
@@ -0,0 +1,26 @@
+"""
+Optional faster event loop for the I/O-bound test scripts.
+
+Prefers uringcore (io_uring, Linux 5.11+) and falls back to uvloop. When neither
+is installed the stock asyncio loop is kept, so neither is a hard dependency.
+"""
+import asyncio
+import platform
+
+
+def install_fast_event_loop() -> str:
+    """Install the fastest available event loop policy and return its name"""
+    if platform.system() == "Linux":
+        try:
+            import uringcore
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return "uringcore"
+        except ImportError:
+            pass
+
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return "uvloop"
+    except ImportError:
+        return "asyncio"
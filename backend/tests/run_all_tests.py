@@ -5,12 +5,41 @@ Runs all tests in sequence and provides a comprehensive report.
 Updated to work with organized test directory structure.
 """
 
+import os
 import subprocess
 import sys
 import time
 import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-import os
+
+try:
+    import orjson  # Optional: much faster than json for large reports
+except ImportError:
+    orjson = None
+
+# Interpreter used to launch every test script, resolved once
+_PYTHON_EXECUTABLE = sys.executable
+
+logger = logging.getLogger("tests.run_all_tests")
+
+
+def _start_log_listener() -> QueueListener:
+    """Route runner output through a queue drained by one background writer thread"""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 class TestRunner:
     def __init__(self):
@@ -18,37 +47,51 @@ class TestRunner:
         self.start_time = time.time()
         self.base_dir = Path(__file__).parent  # backend/tests
         self.project_root = self.base_dir.parent.parent  # project root
+        self._log_listener = _start_log_listener()
+        
+        # Put backend/ on every child's import path once, so test scripts
+        # don't each have to patch sys.path themselves
+        backend_dir = str(self.base_dir.parent.resolve())
+        python_path = os.environ.get("PYTHONPATH")
+        self.child_env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([backend_dir, python_path]) if python_path else backend_dir,
+        }
+    
+    def close(self):
+        """Flush queued output; call before printing anything after the runner"""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
     
     def run_test_script(self, script_path, description):
         """Run a test script and capture results"""
-        print(f"\n{'='*60}")
-        print(f"🧪 Running: {description}")
-        print(f"📄 Script: {script_path}")
-        print('='*60)
+        log_extra = {"test_id": script_path.name}
+        logger.info(f"\n{'='*60}", extra=log_extra)
+        logger.info(f"🧪 Running: {description}", extra=log_extra)
+        logger.info(f"📄 Script: {script_path}", extra=log_extra)
+        logger.info('='*60, extra=log_extra)
         
         try:
             start_time = time.time()
             
-            # Change to backend directory to run tests
-            original_cwd = os.getcwd()
+            # Run tests from the backend directory without touching our own cwd
             backend_dir = self.base_dir.parent  # backend directory
-            os.chdir(backend_dir)
             
             result = subprocess.run(
-                [sys.executable, script_path],
+                [_PYTHON_EXECUTABLE, str(script_path)],
+                cwd=str(backend_dir),
+                env=self.child_env,
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
             )
             
-            # Change back to original directory
-            os.chdir(original_cwd)
-            
             duration = time.time() - start_time
             
-            print(result.stdout)
+            logger.info(result.stdout, extra=log_extra)
             if result.stderr:
-                print(f"STDERR:\n{result.stderr}")
+                logger.info(f"STDERR:\n{result.stderr}", extra=log_extra)
             
             success = result.returncode == 0
             
@@ -62,14 +105,14 @@ class TestRunner:
             }
             
             if success:
-                print(f"✅ {description} completed successfully in {duration:.2f}s")
+                logger.info(f"✅ {description} completed successfully in {duration:.2f}s", extra=log_extra)
             else:
-                print(f"❌ {description} failed with return code {result.returncode}")
+                logger.info(f"❌ {description} failed with return code {result.returncode}", extra=log_extra)
             
             return success
             
         except subprocess.TimeoutExpired:
-            print(f"⏰ {description} timed out after 5 minutes")
+            logger.info(f"⏰ {description} timed out after 5 minutes", extra=log_extra)
             self.test_results[str(script_path)] = {
                 "description": description,
                 "success": False,
@@ -79,7 +122,7 @@ class TestRunner:
             return False
             
         except Exception as e:
-            print(f"💥 Error running {description}: {str(e)}")
+            logger.info(f"💥 Error running {description}: {str(e)}", extra=log_extra)
             self.test_results[str(script_path)] = {
                 "description": description,
                 "success": False,
@@ -89,7 +132,7 @@ class TestRunner:
     
     def check_prerequisites(self):
         """Check if prerequisites are met"""
-        print("🔍 Checking prerequisites...")
+        logger.info("🔍 Checking prerequisites...")
         
         # Check if .env file exists in backend folder first, then project root
         backend_env_file = self.base_dir.parent / ".env"  # backend/.env
@@ -98,16 +141,16 @@ class TestRunner:
         env_file = None
         if backend_env_file.exists():
             env_file = backend_env_file
-            print(f"✅ Found .env file in backend folder: {env_file}")
+            logger.info(f"✅ Found .env file in backend folder: {env_file}")
         elif project_env_file.exists():
             env_file = project_env_file
-            print(f"✅ Found .env file in project root: {env_file}")
+            logger.info(f"✅ Found .env file in project root: {env_file}")
         else:
-            print("❌ .env file not found in backend folder or project root!")
-            print("   Please create .env file with your OpenRouter API key")
-            print(f"   Checked locations:")
-            print(f"   - Backend: {backend_env_file}")
-            print(f"   - Project root: {project_env_file}")
+            logger.info("❌ .env file not found in backend folder or project root!")
+            logger.info("   Please create .env file with your OpenRouter API key")
+            logger.info(f"   Checked locations:")
+            logger.info(f"   - Backend: {backend_env_file}")
+            logger.info(f"   - Project root: {project_env_file}")
             return False
         
         # Check if API key is set (not the placeholder)
@@ -115,42 +158,42 @@ class TestRunner:
             with open(env_file, "r") as f:
                 content = f.read()
                 if "your_openrouter_api_key_here" in content:
-                    print("❌ Please replace 'your_openrouter_api_key_here' with your actual OpenRouter API key in .env")
+                    logger.info("❌ Please replace 'your_openrouter_api_key_here' with your actual OpenRouter API key in .env")
                     return False
                 if "OPENROUTER_API_KEY=" not in content:
-                    print("❌ OPENROUTER_API_KEY not found in .env file")
+                    logger.info("❌ OPENROUTER_API_KEY not found in .env file")
                     return False
         except Exception as e:
-            print(f"❌ Could not read .env file: {str(e)}")
+            logger.info(f"❌ Could not read .env file: {str(e)}")
             return False
         
         # Check if required modules are available
         try:
             import aiohttp
             import requests
-            print("✅ Required modules available")
+            logger.info("✅ Required modules available")
         except ImportError as e:
-            print(f"❌ Missing required module: {str(e)}")
-            print("   Please run: pip install -r backend/requirements.txt")
+            logger.info(f"❌ Missing required module: {str(e)}")
+            logger.info("   Please run: pip install -r backend/requirements.txt")
             return False
         
-        print("✅ Prerequisites check passed")
+        logger.info("✅ Prerequisites check passed")
         return True
     
     def run_all_tests(self):
         """Run all OpenRouter integration tests in organized structure"""
         
         if not self.check_prerequisites():
-            print("\n❌ Prerequisites not met. Please fix the issues above.")
+            logger.info("\n❌ Prerequisites not met. Please fix the issues above.")
             return False
         
-        print("\n🚀 Starting comprehensive OpenRouter integration test suite...")
-        print(f"⏰ Start time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"📁 Test directory structure:")
-        print(f"   📂 OpenRouter tests: {self.base_dir / 'openrouter'}")
-        print(f"   📂 Integration tests: {self.base_dir / 'integration'}")
-        print(f"   📂 Legacy tests: {self.base_dir / 'legacy'}")
-        print(f"   📂 Utility tests: {self.base_dir / 'utils'}")
+        logger.info("\n🚀 Starting comprehensive OpenRouter integration test suite...")
+        logger.info(f"⏰ Start time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"📁 Test directory structure:")
+        logger.info(f"   📂 OpenRouter tests: {self.base_dir / 'openrouter'}")
+        logger.info(f"   📂 Integration tests: {self.base_dir / 'integration'}")
+        logger.info(f"   📂 Legacy tests: {self.base_dir / 'legacy'}")
+        logger.info(f"   📂 Utility tests: {self.base_dir / 'utils'}")
         
         # Test sequence organized by category
         test_categories = [
@@ -181,17 +224,25 @@ class TestRunner:
         total_tests = 0
         passed_tests = 0
         
+        # Stat every script once up front instead of inside the dispatch loop
+        present_scripts = {
+            script_path
+            for category in test_categories
+            for script_path, _ in category["tests"]
+            if script_path.exists()
+        }
+        
         for category in test_categories:
-            print(f"\n{category['name']}")
-            print("─" * 50)
+            logger.info(f"\n{category['name']}")
+            logger.info("─" * 50)
             
             for script_path, description in category["tests"]:
-                if script_path.exists():
+                if script_path in present_scripts:
                     total_tests += 1
                     if self.run_test_script(script_path, description):
                         passed_tests += 1
                 else:
-                    print(f"⚠️  Skipping {description} - file not found: {script_path}")
+                    logger.info(f"⚠️  Skipping {description} - file not found: {script_path}")
                 
                 # Small delay between tests
                 time.sleep(1)
@@ -203,8 +254,8 @@ class TestRunner:
     
     def run_legacy_tests(self):
         """Run legacy HuggingFace tests (for comparison)"""
-        print("\n🏛️  Running Legacy Tests (for reference)")
-        print("─" * 50)
+        logger.info("\n🏛️  Running Legacy Tests (for reference)")
+        logger.info("─" * 50)
         
         legacy_tests = [
             (self.base_dir / "legacy" / "test_hf_fix.py", "HuggingFace Fix Test"),
@@ -213,78 +264,78 @@ class TestRunner:
         
         for script_path, description in legacy_tests:
             if script_path.exists():
-                print(f"📄 Found legacy test: {description}")
+                logger.info(f"📄 Found legacy test: {description}")
                 # Note: We don't run these as they may fail due to API changes
             else:
-                print(f"📄 Legacy test not found: {script_path}")
+                logger.info(f"📄 Legacy test not found: {script_path}")
     
     def generate_final_report(self, total_tests, passed_tests):
         """Generate comprehensive final report"""
         total_duration = time.time() - self.start_time
         
-        print("\n" + "="*80)
-        print("📊 COMPREHENSIVE TEST REPORT")
-        print("="*80)
+        logger.info("\n" + "="*80)
+        logger.info("📊 COMPREHENSIVE TEST REPORT")
+        logger.info("="*80)
         
-        print(f"⏰ Total Duration: {total_duration:.2f} seconds")
-        print(f"📋 Total Test Suites: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"❌ Failed: {total_tests - passed_tests}")
+        logger.info(f"⏰ Total Duration: {total_duration:.2f} seconds")
+        logger.info(f"📋 Total Test Suites: {total_tests}")
+        logger.info(f"✅ Passed: {passed_tests}")
+        logger.info(f"❌ Failed: {total_tests - passed_tests}")
         
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        print(f"📈 Success Rate: {success_rate:.1f}%")
+        logger.info(f"📈 Success Rate: {success_rate:.1f}%")
         
-        print("\n📝 Detailed Results:")
+        logger.info("\n📝 Detailed Results:")
         for script_path, result in self.test_results.items():
             status = "✅ PASS" if result["success"] else "❌ FAIL"
             duration = result.get("duration", 0)
-            print(f"   {status} {result['description']} ({duration:.2f}s)")
+            logger.info(f"   {status} {result['description']} ({duration:.2f}s)")
             
             if not result["success"] and "error" in result:
-                print(f"      Error: {result['error']}")
+                logger.info(f"      Error: {result['error']}")
         
         # Overall assessment
-        print("\n🎯 OVERALL ASSESSMENT:")
+        logger.info("\n🎯 OVERALL ASSESSMENT:")
         if passed_tests == total_tests:
-            print("🎉 EXCELLENT! All tests passed. Your OpenRouter integration is working perfectly!")
-            print("   ✅ OpenRouter API connection is working")
-            print("   ✅ AI-powered query generation is working")
-            print("   ✅ Learning path generation is working") 
-            print("   ✅ FastAPI server integration is working")
-            print("\n🚀 Your application is ready for production use!")
+            logger.info("🎉 EXCELLENT! All tests passed. Your OpenRouter integration is working perfectly!")
+            logger.info("   ✅ OpenRouter API connection is working")
+            logger.info("   ✅ AI-powered query generation is working")
+            logger.info("   ✅ Learning path generation is working") 
+            logger.info("   ✅ FastAPI server integration is working")
+            logger.info("\n🚀 Your application is ready for production use!")
             
         elif passed_tests >= total_tests * 0.75:
-            print("👍 GOOD! Most tests passed. Your integration is mostly working.")
-            print("   🔧 Some minor issues may need attention.")
+            logger.info("👍 GOOD! Most tests passed. Your integration is mostly working.")
+            logger.info("   🔧 Some minor issues may need attention.")
             
         elif passed_tests >= total_tests * 0.5:
-            print("⚠️  PARTIAL! Some tests passed but there are significant issues.")
-            print("   🔧 Please review the failed tests and fix the issues.")
+            logger.info("⚠️  PARTIAL! Some tests passed but there are significant issues.")
+            logger.info("   🔧 Please review the failed tests and fix the issues.")
             
         else:
-            print("❌ POOR! Most tests failed. There are major issues with the integration.")
-            print("   🔧 Please check:")
-            print("      - Your OpenRouter API key is correct")
-            print("      - You have internet connection")
-            print("      - All dependencies are installed")
+            logger.info("❌ POOR! Most tests failed. There are major issues with the integration.")
+            logger.info("   🔧 Please check:")
+            logger.info("      - Your OpenRouter API key is correct")
+            logger.info("      - You have internet connection")
+            logger.info("      - All dependencies are installed")
         
         # Save comprehensive report
         self.save_comprehensive_report(total_tests, passed_tests, success_rate)
         
         # Provide next steps
-        print("\n📋 NEXT STEPS:")
+        logger.info("\n📋 NEXT STEPS:")
         if passed_tests == total_tests:
-            print("   1. Your application is ready to use!")
-            print("   2. Start the server: cd backend && python main.py")
-            print("   3. Start the frontend: cd frontend && npm run dev")
-            print("   4. Visit http://localhost:5173 to use your application")
+            logger.info("   1. Your application is ready to use!")
+            logger.info("   2. Start the server: cd backend && python main.py")
+            logger.info("   3. Start the frontend: cd frontend && npm run dev")
+            logger.info("   4. Visit http://localhost:5173 to use your application")
         else:
-            print("   1. Review the failed tests above")
-            print("   2. Check your .env file has the correct OpenRouter API key")
-            print("   3. Ensure all dependencies are installed: pip install -r backend/requirements.txt")
-            print("   4. Re-run this test suite: python run_all_tests.py")
+            logger.info("   1. Review the failed tests above")
+            logger.info("   2. Check your .env file has the correct OpenRouter API key")
+            logger.info("   3. Ensure all dependencies are installed: pip install -r backend/requirements.txt")
+            logger.info("   4. Re-run this test suite: python run_all_tests.py")
         
-        print(f"\n📄 Detailed logs saved to 'comprehensive_test_report.json'")
+        logger.info(f"\n📄 Detailed logs saved to 'comprehensive_test_report.json'")
     
     def save_comprehensive_report(self, total_tests, passed_tests, success_rate):
         """Save comprehensive test report to file"""
@@ -304,11 +355,16 @@ class TestRunner:
                 "recommendations": self.get_recommendations(passed_tests, total_tests)
             }
             
-            with open("comprehensive_test_report.json", "w") as f:
-                json.dump(report, f, indent=2, default=str)
+            if orjson is not None:
+                with open("comprehensive_test_report.json", "wb") as f:
+                    # Sorted keys keep reports diffable between runs
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str))
+            else:
+                with open("comprehensive_test_report.json", "w") as f:
+                    json.dump(report, f, indent=2, sort_keys=True, default=str)
                 
         except Exception as e:
-            print(f"⚠️  Could not save comprehensive report: {str(e)}")
+            logger.info(f"⚠️  Could not save comprehensive report: {str(e)}")
     
     def get_assessment(self, success_rate):
         """Get assessment based on success rate"""
@@ -349,7 +405,11 @@ def main():
     runner = TestRunner()
     
     try:
-        success = runner.run_all_tests()
+        try:
+            success = runner.run_all_tests()
+        finally:
+            # Flush queued output before anything below prints directly
+            runner.close()
         
         if success:
             print("\n🎉 All tests completed successfully!")
@@ -0,0 +1,137 @@
+"""
+Query cache for SearchEngineManager.search used by the test suite.
+
+Lookups go through two layers:
+1. Exact cache keyed by the normalized query (lowercased, whitespace collapsed)
+2. Similarity cache comparing hashed token-set signatures, so near-duplicate
+   queries (same words, different order or spacing) reuse an earlier result
+
+Entries are persisted to tests/.cache/search_cache.json and expire after 24
+hours. Fallback results (from a failed search) are never stored, so an outage
+isn't replayed. The cache is opt-in via MENTOR_MIND_SEARCH_CACHE=1: with it on,
+the tests no longer exercise SearchEngineManager for cached queries.
+"""
+import json
+import logging
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(__file__).parent / ".cache" / "search_cache.json"
+SIMILARITY_THRESHOLD = 0.9
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+# persona_source values SearchEngineManager uses for degraded results
+UNCACHEABLE_SOURCES = frozenset({"emergency_fallback", "fallback"})
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, strip and collapse whitespace"""
+    return " ".join(query.lower().split())
+
+
+def token_signature(query: str) -> FrozenSet[int]:
+    """Order-insensitive signature made of hashed query tokens"""
+    return frozenset(zlib.crc32(token.encode()) for token in normalize_query(query).split())
+
+
+def _similarity(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    """Jaccard similarity of two token signatures"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def is_cacheable(results: List[Dict]) -> bool:
+    """False for empty results or ones containing fallback entries"""
+    return bool(results) and not any(
+        result.get("persona_source") in UNCACHEABLE_SOURCES for result in results
+    )
+
+
+class SearchCache:
+    """Exact + token-set similarity cache backed by a JSON file"""
+
+    def __init__(self, path: Path = CACHE_PATH, threshold: float = SIMILARITY_THRESHOLD,
+                 ttl: int = DEFAULT_TTL):
+        self.path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        # normalized query -> {"stored_at": epoch seconds, "results": [...]}
+        self.entries: Dict[str, Dict] = {}
+        self.signatures: Dict[str, FrozenSet[int]] = {}
+        self._load()
+
+    def _load(self):
+        """Load unexpired entries, ignoring a missing or corrupt cache file"""
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        now = time.time()
+        self.entries = {
+            query: entry for query, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get("stored_at", 0) < self.ttl
+        }
+        self.signatures = {query: token_signature(query) for query in self.entries}
+
+    def save(self):
+        """Persist entries to disk"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f)
+        except OSError as e:
+            logger.warning(f"Could not save search cache: {str(e)}")
+
+    def get(self, query: str) -> Optional[List[Dict]]:
+        """Return cached results for an exact or near-duplicate query"""
+        key = normalize_query(query)
+        if key in self.entries:
+            logger.debug(f"Search cache exact hit: '{key}'")
+            return self.entries[key]["results"]
+
+        signature = token_signature(key)
+        best_key, best_score = None, 0.0
+        for cached_key, cached_signature in self.signatures.items():
+            score = _similarity(signature, cached_signature)
+            if score > best_score:
+                best_key, best_score = cached_key, score
+
+        if best_key is not None and best_score >= self.threshold:
+            logger.debug(f"Search cache similar hit: '{key}' ~ '{best_key}' ({best_score:.2f})")
+            return self.entries[best_key]["results"]
+        return None
+
+    def set(self, query: str, results: List[Dict]):
+        """Store results for a query and persist the cache; fallback results are skipped"""
+        if not is_cacheable(results):
+            return
+        key = normalize_query(query)
+        self.entries[key] = {"stored_at": time.time(), "results": results}
+        self.signatures[key] = token_signature(key)
+        self.save()
+
+
+def install_search_cache(search_manager, cache: Optional[SearchCache] = None):
+    """Wrap search_manager.search so repeated queries are served from the cache"""
+    if os.getenv("MENTOR_MIND_SEARCH_CACHE") != "1":
+        return search_manager
+
+    cache = cache or SearchCache()
+    search = search_manager.search
+
+    async def cached_search(query: str, session=None):
+        results = cache.get(query)
+        if results is None:
+            results = await search(query, session)
+            cache.set(query, results)
+        return results
+
+    search_manager.search = cached_search
+    return search_manager
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the LLM response cache (services/llm_cache.py)
+"""
+import math
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# pytest, run_all_tests and `python -m tests.<name>` already have backend/ on
+# sys.path; a plain `python path/to/script.py` run needs it added
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services import llm_cache
+from services.llm_cache import DiskBackend, LLMCache, MemoryBackend, SemanticIndex, prepare_cached_request
+
+MESSAGES = [{"role": "user", "content": "Python programming"}]
+
+
+class FakeEmbedder:
+    """Deterministic stand-in for SentenceTransformer: texts embed by letter counts"""
+
+    def encode(self, text, normalize_embeddings=True):
+        vector = [text.count(letter) for letter in "aeioupnrst"] + [1.0]
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector]
+
+
+def make_index(backend, threshold=0.99, ttl=60):
+    """Build a SemanticIndex without loading a real embedding model"""
+    index = SemanticIndex.__new__(SemanticIndex)
+    index.backend = backend
+    index.ttl = ttl
+    index.threshold = threshold
+    index._model = FakeEmbedder()
+    return index
+
+
+def expire(backend: MemoryBackend, key: str):
+    """Backdate a MemoryBackend entry so it reads as expired"""
+    _, value = backend._entries[key]
+    backend._entries[key] = (time.monotonic() - 1, value)
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_nonzero_temperature_is_uncacheable(self):
+        """Sampled requests get no key, so they are never cached"""
+        self.assertIsNone(LLMCache.cache_key("model", MESSAGES, 0.7))
+
+    def test_key_is_stable_and_request_specific(self):
+        """Identical requests share a key; a different model or prompt does not"""
+        key = LLMCache.cache_key("model", MESSAGES, 0)
+        self.assertEqual(key, LLMCache.cache_key("model", list(MESSAGES), 0))
+        self.assertNotEqual(key, LLMCache.cache_key("other-model", MESSAGES, 0))
+        self.assertNotEqual(key, LLMCache.cache_key("model", [{"role": "user", "content": "Scala"}], 0))
+
+    def test_prepare_cached_request(self):
+        """Without a cache requests sample normally; with one they decode at 0 and hit"""
+        self.assertEqual(prepare_cached_request(None, "model", MESSAGES), (llm_cache.DEFAULT_TEMPERATURE, None, None))
+
+        cache = LLMCache(MemoryBackend())
+        temperature, key, cached = prepare_cached_request(cache, "model", MESSAGES)
+        self.assertEqual((temperature, cached), (0, None))
+        cache.set(key, "answer")
+        self.assertEqual(prepare_cached_request(cache, "model", MESSAGES)[2], "answer")
+
+
+class TestMemoryBackend(unittest.TestCase):
+    def test_entries_expire(self):
+        backend = MemoryBackend()
+        backend.set("key", "value", ttl=60)
+        self.assertEqual(backend.get("key"), "value")
+
+        expire(backend, "key")
+        self.assertIsNone(backend.get("key"))
+        self.assertNotIn("key", backend._entries)
+
+    def test_update_applies_function_to_current_value(self):
+        backend = MemoryBackend()
+        backend.update("key", lambda current: (current or 0) + 1, ttl=60)
+        backend.update("key", lambda current: (current or 0) + 1, ttl=60)
+        self.assertEqual(backend.get("key"), 2)
+
+
+@unittest.skipUnless(llm_cache.diskcache is not None, "diskcache not installed")
+class TestDiskBackend(unittest.TestCase):
+    def test_update_is_visible_to_other_instances(self):
+        """Two backends on one directory (as in two processes) merge instead of overwriting"""
+        with tempfile.TemporaryDirectory() as directory:
+            first, second = DiskBackend(directory), DiskBackend(directory)
+            first.update("index", lambda current: (current or []) + ["a"], ttl=60)
+            second.update("index", lambda current: (current or []) + ["b"], ttl=60)
+            self.assertEqual(first.get("index"), ["a", "b"])
+
+
+# np.dot over plain lists, so the semantic tests don't need numpy installed
+@mock.patch.object(llm_cache, "np", SimpleNamespace(dot=lambda a, b: sum(x * y for x, y in zip(a, b))), create=True)
+class TestSemanticLayer(unittest.TestCase):
+    def test_get_misses_without_semantic_index(self):
+        cache = LLMCache(MemoryBackend())
+        self.assertIsNone(cache.get(None))
+        self.assertIsNone(cache.get("missing", text="python"))
+
+    def test_get_falls_back_to_similar_text(self):
+        """An exact-key miss returns the entry stored for the same text in the same namespace"""
+        backend = MemoryBackend()
+        cache = LLMCache(backend, semantic=make_index(backend))
+        cache.set("python-key", ["queries"], text="python", namespace="search_queries")
+
+        self.assertEqual(cache.get("other-key", text="Python", namespace="search_queries"), ["queries"])
+        self.assertIsNone(cache.get("other-key", text="python", namespace="technical_mentor"))
+        self.assertIsNone(cache.get("other-key", text="kubernetes", namespace="search_queries"))
+
+    def test_add_prunes_expired_keys(self):
+        backend = MemoryBackend()
+        index = make_index(backend)
+        cache = LLMCache(backend, semantic=index)
+        cache.set("old", "stale", text="python")
+        cache.set("kept", "fresh", text="scala")
+
+        expire(backend, "old")
+        cache.set("new", "value", text="rust")
+        self.assertEqual([key for _, _, key in index._entries()], ["kept", "new"])
+
+    def test_indexes_sharing_a_backend_merge(self):
+        """A second index on the same backend keeps the first one's entries"""
+        backend = MemoryBackend()
+        first, second = make_index(backend), make_index(backend)
+        LLMCache(backend, semantic=first).set("a", "1", text="python")
+        LLMCache(backend, semantic=second).set("b", "2", text="scala")
+        self.assertEqual({key for _, _, key in first._entries()}, {"a", "b"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -7,29 +7,102 @@ import sys
 import os
 import logging
 import unittest
+from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import aiohttp
+
+# pytest, run_all_tests and `python -m tests.<name>` already have backend/ on
+# sys.path; a plain `python path/to/script.py` run needs it added
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from services import ContentAggregator, Resource, SearchEngineManager, FallbackDataProvider
+from tests.search_cache import install_search_cache
+from tests.event_loop import install_fast_event_loop
+
+install_fast_event_loop()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Set MENTOR_MIND_FAST_TESTS=1 to skip the per-category tests and rely on the
+# concurrent all-categories test instead
+FAST_TESTS = os.getenv("MENTOR_MIND_FAST_TESTS") == "1"
+skip_if_fast = unittest.skipIf(FAST_TESTS, "covered by test_content_aggregator_all_categories")
+
+# Set MENTOR_MIND_LIVE_TESTS=1 to make every test hit the aggregator itself
+# instead of reading the results prefetched in setUpClass
+LIVE_TESTS = os.getenv("MENTOR_MIND_LIVE_TESTS") == "1"
+
+# Every (method, topic, queries) call the category tests assert on
+PREFETCH_CALLS = [
+    ('get_documentation', 'scala', ()),
+    ('get_blogs', 'python', ('django tutorial',)),
+    ('get_youtube_videos', 'react', ()),
+    ('get_free_courses', 'javascript', ()),
+    ('get_paid_courses', 'react', ()),
+]
+
+# Hosts the aggregator talks to; warmed once before the gathered prefetch
+WARMUP_HOSTS = ['openrouter.ai']
+
+
+def make_connector():
+    """Pooled keep-alive connector that resolves DNS via aiodns when installed"""
+    try:
+        # Without aiodns, aiohttp resolves names on the default thread pool
+        resolver = aiohttp.AsyncResolver()
+    except RuntimeError:
+        resolver = None
+    return aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30, resolver=resolver)
+
 
 class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
     """Test cases for the refactored ContentAggregator system"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Prefetch every category result once so individual tests skip the network"""
+        super().setUpClass()
+        cls._cache = {} if LIVE_TESTS else asyncio.run(cls._prefetch())
+    
+    @classmethod
+    async def _prefetch(cls):
+        """Run all PREFETCH_CALLS concurrently on a single aggregator"""
+        async with aiohttp.ClientSession(connector=make_connector()) as session:
+            aggregator = ContentAggregator(session=session)
+            # Pay DNS + TLS setup once instead of in every concurrent call
+            await aggregator.warmup(WARMUP_HOSTS)
+            results = await asyncio.gather(*(
+                getattr(aggregator, method)(topic, list(queries))
+                for method, topic, queries in PREFETCH_CALLS
+            ))
+            await aggregator.close()
+        return dict(zip(PREFETCH_CALLS, results))
+    
+    async def _fetch(self, method, topic, queries=()):
+        """Return the prefetched result for a call, or make it live on a cache miss"""
+        key = (method, topic, tuple(queries))
+        if key in self._cache:
+            return self._cache[key]
+        return await getattr(self.aggregator, method)(topic, list(queries))
+    
     async def asyncSetUp(self):
         """Set up test fixtures"""
-        self.aggregator = ContentAggregator()
-        self.search_manager = SearchEngineManager()
+        # One pooled keep-alive session shared by every component in the test.
+        # IsolatedAsyncioTestCase runs each test on its own event loop, so the
+        # session can't outlive a single test.
+        self._session = aiohttp.ClientSession(connector=make_connector())
+        self.aggregator = ContentAggregator(session=self._session)
+        self.search_manager = install_search_cache(SearchEngineManager())
         self.fallback_provider = FallbackDataProvider()
     
     async def asyncTearDown(self):
         """Clean up after tests"""
         await self.aggregator.close()
+        await self.search_manager.close()
+        await self._session.close()
     
     async def test_imports_and_initialization(self):
         """Test that all modules import correctly and can be initialized"""
@@ -91,31 +164,30 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         """Test SearchEngineManager functionality"""
         logger.info("Testing SearchEngineManager...")
         
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            try:
-                # Test search functionality
-                results = await self.search_manager.search('python tutorial', session)
-                self.assertIsInstance(results, list)
-                
-                # Results should have the required structure
-                if results:
-                    result = results[0]
-                    self.assertIn('title', result)
-                    self.assertIn('url', result)
-                    self.assertIn('description', result)
-                
-                logger.info(f"✅ SearchEngineManager returned {len(results)} results")
-                
-            except Exception as e:
-                logger.warning(f"SearchEngineManager test failed (expected in some environments): {e}")
+        try:
+            # Test search functionality
+            results = await self.search_manager.search('python tutorial', self._session)
+            self.assertIsInstance(results, list)
+            
+            # Results should have the required structure
+            if results:
+                result = results[0]
+                self.assertIn('title', result)
+                self.assertIn('url', result)
+                self.assertIn('description', result)
+            
+            logger.info(f"✅ SearchEngineManager returned {len(results)} results")
+            
+        except Exception as e:
+            logger.warning(f"SearchEngineManager test failed (expected in some environments): {e}")
     
+    @skip_if_fast
     async def test_content_aggregator_documentation(self):
         """Test ContentAggregator documentation gathering"""
         logger.info("Testing ContentAggregator documentation...")
         
         # Test with Scala (has predefined docs)
-        docs = await self.aggregator.get_documentation('scala', [])
+        docs = await self._fetch('get_documentation', 'scala')
         self.assertIsInstance(docs, list)
         self.assertGreater(len(docs), 0)
         self.assertLessEqual(len(docs), 5)  # Should limit to 5
@@ -128,11 +200,12 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         
         logger.info(f"✅ Documentation test passed - found {len(docs)} docs")
     
+    @skip_if_fast
     async def test_content_aggregator_blogs(self):
         """Test ContentAggregator blog gathering"""
         logger.info("Testing ContentAggregator blogs...")
         
-        blogs = await self.aggregator.get_blogs('python', ['django tutorial'])
+        blogs = await self._fetch('get_blogs', 'python', ('django tutorial',))
         self.assertIsInstance(blogs, list)
         self.assertLessEqual(len(blogs), 5)  # Should limit to 5
         
@@ -142,11 +215,12 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         
         logger.info(f"✅ Blogs test passed - found {len(blogs)} blogs")
     
+    @skip_if_fast
     async def test_content_aggregator_youtube(self):
         """Test ContentAggregator YouTube video gathering"""
         logger.info("Testing ContentAggregator YouTube...")
         
-        videos = await self.aggregator.get_youtube_videos('react', [])
+        videos = await self._fetch('get_youtube_videos', 'react')
         self.assertIsInstance(videos, list)
         self.assertLessEqual(len(videos), 5)  # Should limit to 5
         
@@ -156,17 +230,18 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         
         logger.info(f"✅ YouTube test passed - found {len(videos)} videos")
     
+    @skip_if_fast
     async def test_content_aggregator_courses(self):
         """Test ContentAggregator course gathering"""
         logger.info("Testing ContentAggregator courses...")
         
         # Test free courses
-        free_courses = await self.aggregator.get_free_courses('javascript', [])
+        free_courses = await self._fetch('get_free_courses', 'javascript')
         self.assertIsInstance(free_courses, list)
         self.assertLessEqual(len(free_courses), 5)
         
         # Test paid courses
-        paid_courses = await self.aggregator.get_paid_courses('react', [])
+        paid_courses = await self._fetch('get_paid_courses', 'react')
         self.assertIsInstance(paid_courses, list)
         self.assertLessEqual(len(paid_courses), 5)
         
@@ -176,6 +251,29 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         
         logger.info(f"✅ Courses test passed - found {len(free_courses)} free, {len(paid_courses)} paid")
     
+    async def test_content_aggregator_all_categories(self):
+        """Test all ContentAggregator categories concurrently"""
+        logger.info("Testing all ContentAggregator categories concurrently...")
+        
+        results = await asyncio.gather(
+            self._fetch('get_documentation', 'scala'),
+            self._fetch('get_blogs', 'python', ('django tutorial',)),
+            self._fetch('get_youtube_videos', 'react'),
+            self._fetch('get_free_courses', 'javascript'),
+            self._fetch('get_paid_courses', 'react')
+        )
+        
+        for resources in results:
+            self.assertIsInstance(resources, list)
+            self.assertLessEqual(len(resources), 5)  # Should limit to 5
+            for resource in resources:
+                self.assertIsInstance(resource, Resource)
+        
+        # Scala has predefined docs, so documentation should never be empty
+        self.assertGreater(len(results[0]), 0)
+        
+        logger.info(f"✅ All categories test passed - found {sum(len(r) for r in results)} resources")
+    
     async def test_context_manager(self):
         """Test ContentAggregator context manager functionality"""
         logger.info("Testing ContentAggregator context manager...")
@@ -191,49 +289,82 @@ class TestRefactoredContentAggregator(unittest.IsolatedAsyncioTestCase):
         logger.info("✅ Context manager test passed")
 
 
+def _fmt(items, fields=("title", "platform"), n=2):
+    """Render the first n resources as numbered "title (platform)" lines"""
+    return "\n".join(
+        f"  {i}. {getattr(x, fields[0])} ({getattr(x, fields[1])})"
+        for i, x in enumerate(items[:n], 1)
+    )
+
 async def run_manual_tests():
     """Run manual tests with detailed output"""
     print("\n" + "="*60)
     print("🧪 MANUAL TESTING OF REFACTORED CONTENT AGGREGATOR")
     print("="*60)
     
-    async with ContentAggregator() as aggregator:
+    # Explicit pool limits so topic x category fan-out never queues on the connector
+    connector = aiohttp.TCPConnector(limit=200, limit_per_host=30)
+    async with aiohttp.ClientSession(connector=connector) as session, \
+            ContentAggregator(session=session) as aggregator:
         # Test with different topics
         topics = ['scala', 'python', 'react']
+        categories = ['get_documentation', 'get_blogs', 'get_youtube_videos',
+                      'get_free_courses', 'get_paid_courses']
+        
+        # Bound in-flight calls across all topics
+        sem = asyncio.Semaphore(16)
+        
+        async def bound(coro):
+            async with sem:
+                return await coro
+        
+        async def probe(topic):
+            # All five categories are independent, so fetch them concurrently
+            return await asyncio.gather(
+                *(bound(getattr(aggregator, category)(topic, [])) for category in categories)
+            )
+        
+        # A failing topic comes back as its exception so the others still report
+        results = await asyncio.gather(*(probe(topic) for topic in topics), return_exceptions=True)
         
-        for topic in topics:
-            print(f"\n📋 Testing topic: {topic.upper()}")
-            print("-" * 40)
+        # Build each topic's report in memory and emit it with a single write
+        for topic, result in zip(topics, results):
+            lines = [f"\n📋 Testing topic: {topic.upper()}", "-" * 40]
             
-            try:
-                # Documentation
-                docs = await aggregator.get_documentation(topic, [])
-                print(f"📚 Documentation: {len(docs)} resources")
-                for i, doc in enumerate(docs[:2], 1):
-                    print(f"  {i}. {doc.title} ({doc.platform})")
-                
-                # Blogs
-                blogs = await aggregator.get_blogs(topic, [])
-                print(f"📝 Blogs: {len(blogs)} resources")
-                for i, blog in enumerate(blogs[:2], 1):
-                    print(f"  {i}. {blog.title} ({blog.platform})")
-                
-                # Courses
-                courses = await aggregator.get_free_courses(topic, [])
-                print(f"🎓 Free Courses: {len(courses)} resources")
-                for i, course in enumerate(courses[:2], 1):
-                    print(f"  {i}. {course.title} ({course.platform})")
-                    
-            except Exception as e:
-                print(f"❌ Error testing {topic}: {e}")
+            if isinstance(result, Exception):
+                lines.append(f"❌ Error testing {topic}: {result}")
+                sys.stdout.write("\n".join(lines) + "\n")
+                continue
+            
+            docs, blogs, videos, free_courses, paid_courses = result
+            
+            # Documentation
+            lines.append(f"📚 Documentation: {len(docs)} resources")
+            lines.append(_fmt(docs))
+            
+            # Blogs
+            lines.append(f"📝 Blogs: {len(blogs)} resources")
+            lines.append(_fmt(blogs))
+            
+            # Videos
+            lines.append(f"🎥 YouTube: {len(videos)} resources")
+            lines.append(_fmt(videos))
+            
+            # Courses
+            lines.append(f"🎓 Free Courses: {len(free_courses)} resources")
+            lines.append(_fmt(free_courses))
+            
+            lines.append(f"💰 Paid Courses: {len(paid_courses)} resources")
+            lines.append(_fmt(paid_courses))
+            
+            sys.stdout.write("\n".join(lines) + "\n")
         
         print(f"\n✅ Manual testing completed successfully!")
 
-
 if __name__ == "__main__":
     # Run unit tests
     print("Running unit tests...")
     unittest.main(argv=[''], exit=False, verbosity=2)
     
     # Run manual tests
-    asyncio.run(run_manual_tests()) 
\ No newline at end of file
+    asyncio.run(run_manual_tests())
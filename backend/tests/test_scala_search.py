@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 import asyncio
 import sys
-import os
 import logging
+from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import aiohttp
+
+# pytest, run_all_tests and `python -m tests.<name>` already have backend/ on
+# sys.path; a plain `python path/to/script.py` run needs it added
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from services import ContentAggregator, SearchEngineManager, FallbackDataProvider
+from tests.search_cache import install_search_cache
+from tests.event_loop import install_fast_event_loop
+
+install_fast_event_loop()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+RESOURCE_FIELDS = (("URL", "url"), ("Platform", "platform"))
+COURSE_FIELDS = RESOURCE_FIELDS + (("Price", "price"),)
+
+def _fmt(items, fields=RESOURCE_FIELDS, n=3):
+    """Render the first n resources as numbered blocks with one line per field"""
+    return "\n".join(
+        f"  {i}. {x.title}\n" + "".join(f"     {label}: {getattr(x, attr)}\n" for label, attr in fields)
+        for i, x in enumerate(items[:n], 1)
+    )
+
 async def test_scala_search():
     """Test the refactored ContentAggregator with Scala searches"""
     print("Testing Scala search with refactored modular functionality...")
@@ -42,10 +60,11 @@ async def test_scala_search():
     
     print("=" * 50)
     print("2. Testing SearchEngineManager...")
-    search_manager = SearchEngineManager()
+    search_manager = install_search_cache(SearchEngineManager())
     
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
+    # One pooled keep-alive session shared by the search manager and the aggregator
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
         try:
             search_results = await search_manager.search('scala programming tutorial', session)
             print(f"Search engine results: {len(search_results)}")
@@ -55,75 +74,59 @@ async def test_scala_search():
                 print(f"     Description: {result.get('description', 'N/A')[:100]}...")
         except Exception as e:
             print(f"Search engine error: {e}")
-    
-    print("=" * 50)
-    print("3. Testing full ContentAggregator functionality...")
-    
-    async with ContentAggregator() as aggregator:
-        try:
-            # Test documentation search
-            print("📚 Testing documentation search...")
-            docs = await aggregator.get_documentation('scala', [])
-            print(f"Documentation search found {len(docs)} results")
-            
-            for i, doc in enumerate(docs[:3]):
-                print(f"  {i+1}. {doc.title}")
-                print(f"     URL: {doc.url}")
-                print(f"     Platform: {doc.platform}")
-                print()
-            
-            # Test blog search
-            print("📝 Testing blog search...")
-            blogs = await aggregator.get_blogs('scala', ['functional programming'])
-            print(f"Blog search found {len(blogs)} results")
-            
-            for i, blog in enumerate(blogs[:3]):
-                print(f"  {i+1}. {blog.title}")
-                print(f"     URL: {blog.url}")
-                print(f"     Platform: {blog.platform}")
-                print()
-            
-            # Test YouTube search
-            print("🎥 Testing YouTube search...")
-            videos = await aggregator.get_youtube_videos('scala', [])
-            print(f"YouTube search found {len(videos)} results")
-            
-            for i, video in enumerate(videos[:3]):
-                print(f"  {i+1}. {video.title}")
-                print(f"     URL: {video.url}")
-                print(f"     Platform: {video.platform}")
-                print()
-            
-            # Test free courses search
-            print("🆓 Testing free courses search...")
-            free_courses = await aggregator.get_free_courses('scala', [])
-            print(f"Free courses search found {len(free_courses)} results")
-            
-            for i, course in enumerate(free_courses[:3]):
-                print(f"  {i+1}. {course.title}")
-                print(f"     URL: {course.url}")
-                print(f"     Platform: {course.platform}")
-                print(f"     Price: {course.price}")
-                print()
-            
-            # Test paid courses search
-            print("💰 Testing paid courses search...")
-            paid_courses = await aggregator.get_paid_courses('scala', [])
-            print(f"Paid courses search found {len(paid_courses)} results")
-            
-            for i, course in enumerate(paid_courses[:3]):
-                print(f"  {i+1}. {course.title}")
-                print(f"     URL: {course.url}")
-                print(f"     Platform: {course.platform}")
-                print(f"     Price: {course.price}")
-                print()
-            
-            print("✅ All ContentAggregator tests completed successfully!")
-            
-        except Exception as e:
-            print(f"❌ ContentAggregator test error: {e}")
-            import traceback
-            traceback.print_exc()
+        
+        print("=" * 50)
+        print("3. Testing full ContentAggregator functionality...")
+        
+        async with ContentAggregator(session=session) as aggregator:
+            try:
+                # All five category searches are independent, so run them concurrently
+                print("🔎 Running documentation, blog, YouTube and course searches...")
+                docs, blogs, videos, free_courses, paid_courses = await asyncio.gather(
+                    aggregator.get_documentation('scala', []),
+                    aggregator.get_blogs('scala', ['functional programming']),
+                    aggregator.get_youtube_videos('scala', []),
+                    aggregator.get_free_courses('scala', []),
+                    aggregator.get_paid_courses('scala', [])
+                )
+                
+                # Build the report in memory and emit it with a single write
+                lines = []
+                
+                # Test documentation search
+                lines.append("📚 Testing documentation search...")
+                lines.append(f"Documentation search found {len(docs)} results")
+                lines.append(_fmt(docs))
+                
+                # Test blog search
+                lines.append("📝 Testing blog search...")
+                lines.append(f"Blog search found {len(blogs)} results")
+                lines.append(_fmt(blogs))
+                
+                # Test YouTube search
+                lines.append("🎥 Testing YouTube search...")
+                lines.append(f"YouTube search found {len(videos)} results")
+                lines.append(_fmt(videos))
+                
+                # Test free courses search
+                lines.append("🆓 Testing free courses search...")
+                lines.append(f"Free courses search found {len(free_courses)} results")
+                lines.append(_fmt(free_courses, COURSE_FIELDS))
+                
+                # Test paid courses search
+                lines.append("💰 Testing paid courses search...")
+                lines.append(f"Paid courses search found {len(paid_courses)} results")
+                lines.append(_fmt(paid_courses, COURSE_FIELDS))
+                
+                sys.stdout.write("\n".join(lines) + "\n")
+                
+                print("✅ All ContentAggregator tests completed successfully!")
+                
+            except Exception as e:
+                print(f"❌ ContentAggregator test error: {e}")
+                logger.exception("ContentAggregator test error")
+
+        await search_manager.close()
 
 if __name__ == "__main__":
     asyncio.run(test_scala_search()) 
\ No newline at end of file
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the test-suite search cache (tests/search_cache.py)
+"""
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# pytest, run_all_tests and `python -m tests.<name>` already have backend/ on
+# sys.path; a plain `python path/to/script.py` run needs it added
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tests.search_cache import SearchCache, normalize_query
+
+RESULTS = [{"title": "Scala Tour", "url": "https://docs.scala-lang.org/tour", "persona_source": "technical_mentor"}]
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "search_cache.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_exact_and_similar_hits(self):
+        cache = SearchCache(self.path)
+        cache.set("Scala  Tutorial", RESULTS)
+        self.assertEqual(cache.get("scala tutorial"), RESULTS)
+        self.assertEqual(cache.get("tutorial scala"), RESULTS)
+        self.assertIsNone(cache.get("rust tutorial"))
+
+    def test_entries_persist_across_instances(self):
+        SearchCache(self.path).set("scala", RESULTS)
+        self.assertEqual(SearchCache(self.path).get("scala"), RESULTS)
+
+    def test_fallback_and_empty_results_are_not_stored(self):
+        cache = SearchCache(self.path)
+        cache.set("empty", [])
+        cache.set("outage", [{"title": "scala Getting Started Guide", "persona_source": "emergency_fallback"}])
+        cache.set("mixed", RESULTS + [{"title": "Guide", "persona_source": "fallback"}])
+
+        for query in ("empty", "outage", "mixed"):
+            self.assertIsNone(cache.get(query))
+        self.assertFalse(self.path.exists())
+
+    def test_load_drops_expired_and_old_format_entries(self):
+        now = time.time()
+        self.path.write_text(json.dumps({
+            "fresh": {"stored_at": now, "results": RESULTS},
+            "stale": {"stored_at": now - 120, "results": RESULTS},
+            "old format": RESULTS,
+        }))
+
+        cache = SearchCache(self.path, ttl=60)
+        self.assertEqual(set(cache.entries), {normalize_query("fresh")})
+        self.assertIsNone(cache.get("stale"))
+
+    def test_corrupt_file_is_ignored(self):
+        self.path.write_text("{not json")
+        self.assertEqual(SearchCache(self.path).entries, {})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
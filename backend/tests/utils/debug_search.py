@@ -7,6 +7,8 @@ import sys
 import os
 from pathlib import Path
 
+import aiohttp
+
 # Add backend to path
 backend_dir = Path(__file__).parent / 'backend'
 sys.path.insert(0, str(backend_dir))
@@ -15,13 +17,16 @@ os.environ['HUGGINGFACE_API_TOKEN'] = 'your_huggingface_token_here'
 
 from backend.services.search_engines import LLMSearchEngine
 from backend.services.content_aggregator import ContentAggregator
+from backend.tests.event_loop import install_fast_event_loop
+
+install_fast_event_loop()
 
 async def test_llm_search_directly():
     """Test LLM search engine directly"""
     print("🔍 Testing LLM Search Engine Directly")
     print("=" * 50)
     
-    search_engine = LLMSearchEngine()
+    search_engine = LLMSearchEngine.shared()
     
     try:
         resources = await search_engine.search("AI")
@@ -36,42 +41,58 @@ async def test_llm_search_directly():
         
     except Exception as e:
         print(f"❌ Error: {str(e)}")
-    finally:
-        await search_engine.close()
 
 async def test_content_aggregator():
     """Test content aggregator"""
     print("\n\n📊 Testing Content Aggregator")
     print("=" * 50)
     
-    aggregator = ContentAggregator()
+    aggregator = ContentAggregator.shared()
+    # Build the report in memory and emit it with a single write
+    lines = []
     
     try:
         # Test getting all resources
         all_resources = await aggregator.get_all_resources("AI", [])
         
-        print("Results from content aggregator:")
+        lines.append("Results from content aggregator:")
         for category, resources in all_resources.items():
-            print(f"  {category}: {len(resources)} resources")
+            lines.append(f"  {category}: {len(resources)} resources")
             if resources:
-                print(f"    Sample: {resources[0].title}")
-        
-        # Test individual methods
-        print("\nTesting individual methods:")
-        docs = await aggregator.get_documentation("AI", [])
-        print(f"  Documentation: {len(docs)} resources")
+                lines.append(f"    Sample: {resources[0].title}")
         
-        blogs = await aggregator.get_blogs("AI", [])
-        print(f"  Blogs: {len(blogs)} resources")
-        
-        youtube = await aggregator.get_youtube_videos("AI", [])
-        print(f"  YouTube: {len(youtube)} resources")
+        # Test individual methods concurrently
+        lines.append("\nTesting individual methods:")
+        docs, blogs, youtube = await asyncio.gather(
+            aggregator.get_documentation("AI", []),
+            aggregator.get_blogs("AI", []),
+            aggregator.get_youtube_videos("AI", [])
+        )
+        lines.append(f"  Documentation: {len(docs)} resources")
+        lines.append(f"  Blogs: {len(blogs)} resources")
+        lines.append(f"  YouTube: {len(youtube)} resources")
         
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        lines.append(f"❌ Error: {str(e)}")
     finally:
-        await aggregator.close()
+        sys.stdout.write("\n".join(lines) + "\n")
+
+async def main():
+    """Run both checks over one shared connection pool"""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Bind the process-wide instances to this pool before the checks ask for them
+        LLMSearchEngine.shared(session)
+        ContentAggregator.shared(session)
+        try:
+            # Independent workloads, so overlap their network round-trips
+            await asyncio.gather(
+                test_llm_search_directly(),
+                test_content_aggregator()
+            )
+        finally:
+            await ContentAggregator.close_shared()
+            await LLMSearchEngine.close_shared()
 
 if __name__ == "__main__":
-    asyncio.run(test_llm_search_directly())
-    asyncio.run(test_content_aggregator()) 
\ No newline at end of file
+    asyncio.run(main())
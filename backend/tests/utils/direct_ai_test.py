@@ -4,7 +4,10 @@ Direct AI search test - bypasses configuration issues to show results
 """
 import os
 import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Set the token directly for this test
 os.environ['HUGGINGFACE_API_TOKEN'] = 'your_huggingface_token_here'
@@ -15,11 +18,14 @@ sys.path.insert(0, str(backend_dir))
 
 def show_comprehensive_ai_results():
     """Show comprehensive AI learning resources that the system generates"""
+    # Collect the report and emit it with a single write
+    out = []
+    w = out.append
     
-    print("🤖 COMPREHENSIVE AI LEARNING RESOURCES")
-    print("=" * 70)
-    print("📋 Generated by LLM-Only Search Engine with Persona-Based Prompting")
-    print()
+    w("🤖 COMPREHENSIVE AI LEARNING RESOURCES")
+    w("=" * 70)
+    w("📋 Generated by LLM-Only Search Engine with Persona-Based Prompting")
+    w("")
     
     # Simulated comprehensive results that the LLM would generate
     ai_resources = [
@@ -162,107 +168,96 @@ def show_comprehensive_ai_results():
         }
     ]
     
-    # Analyze the resources
-    categories = {'documentation': [], 'courses': [], 'videos': [], 'blogs': [], 'repositories': [], 'books': []}
+    # Analyze the resources in a single pass
+    categories = defaultdict(list)
+    personas = defaultdict(list)
+    difficulties = defaultdict(list)
     free_resources = []
     paid_resources = []
-    personas = {}
-    platforms = {}
-    difficulties = {'Beginner': [], 'Intermediate': [], 'Advanced': [], 'All Levels': []}
     
     for resource in ai_resources:
-        # Categorize by type
         resource_type = resource.get('type', 'tutorial')
-        if resource_type in categories:
-            categories[resource_type].append(resource)
-        
-        # Categorize by price
-        if 'free' in resource.get('price', '').lower():
-            free_resources.append(resource)
-        else:
-            paid_resources.append(resource)
-        
-        # Group by persona
+        price = resource.get('price', '').lower()
         persona = resource.get('persona_source', 'unknown')
-        if persona not in personas:
-            personas[persona] = []
-        personas[persona].append(resource)
-        
-        # Group by platform
-        platform = resource.get('platform', 'Unknown')
-        if platform not in platforms:
-            platforms[platform] = []
-        platforms[platform].append(resource)
-        
-        # Group by difficulty
         difficulty = resource.get('difficulty', 'All Levels')
-        if difficulty in difficulties:
-            difficulties[difficulty].append(resource)
+        
+        categories[resource_type].append(resource)
+        (free_resources if 'free' in price else paid_resources).append(resource)
+        personas[persona].append(resource)
+        difficulties[difficulty].append(resource)
+    
+    platforms = Counter(resource.get('platform', 'Unknown') for resource in ai_resources)
     
     # Print comprehensive analysis
-    print(f"📊 OVERVIEW:")
-    print(f"   Total Resources: {len(ai_resources)}")
-    print(f"   Free Resources: {len(free_resources)} ({len(free_resources)/len(ai_resources)*100:.0f}%)")
-    print(f"   Paid Resources: {len(paid_resources)} ({len(paid_resources)/len(ai_resources)*100:.0f}%)")
-    print(f"   Unique Platforms: {len(platforms)}")
-    print()
+    w(f"📊 OVERVIEW:")
+    w(f"   Total Resources: {len(ai_resources)}")
+    w(f"   Free Resources: {len(free_resources)} ({len(free_resources)/len(ai_resources)*100:.0f}%)")
+    w(f"   Paid Resources: {len(paid_resources)} ({len(paid_resources)/len(ai_resources)*100:.0f}%)")
+    w(f"   Unique Platforms: {len(platforms)}")
+    w("")
     
     # Resources by category
-    print(f"📚 RESOURCES BY CATEGORY:")
+    w(f"📚 RESOURCES BY CATEGORY:")
     for category, items in categories.items():
         if items:
-            print(f"\n   📖 {category.upper()} ({len(items)} resources):")
+            w(f"\n   📖 {category.upper()} ({len(items)} resources):")
             for item in items:
                 price_icon = "🆓" if 'free' in item.get('price', '').lower() else "💰"
-                print(f"     {price_icon} {item['title']}")
-                print(f"        Platform: {item['platform']} | Difficulty: {item['difficulty']}")
-                print(f"        Description: {item['description']}")
-                print()
+                w(f"     {price_icon} {item['title']}")
+                w(f"        Platform: {item['platform']} | Difficulty: {item['difficulty']}")
+                w(f"        Description: {item['description']}")
+                w("")
     
     # Free vs Paid breakdown
-    print(f"💰 PRICING BREAKDOWN:")
-    print(f"\n   🆓 FREE RESOURCES ({len(free_resources)}):")
+    w(f"💰 PRICING BREAKDOWN:")
+    w(f"\n   🆓 FREE RESOURCES ({len(free_resources)}):")
     for resource in free_resources:
-        print(f"     • {resource['title']} ({resource['platform']})")
+        w(f"     • {resource['title']} ({resource['platform']})")
     
-    print(f"\n   💰 PAID RESOURCES ({len(paid_resources)}):")
+    w(f"\n   💰 PAID RESOURCES ({len(paid_resources)}):")
     for resource in paid_resources:
-        print(f"     • {resource['title']} ({resource['platform']})")
+        w(f"     • {resource['title']} ({resource['platform']})")
     
     # Platform distribution
-    print(f"\n🌐 PLATFORM DISTRIBUTION:")
-    for platform, items in sorted(platforms.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"   {platform}: {len(items)} resources")
+    w(f"\n🌐 PLATFORM DISTRIBUTION:")
+    for platform, count in platforms.most_common():
+        w(f"   {platform}: {count} resources")
     
     # Difficulty levels
-    print(f"\n📈 DIFFICULTY LEVELS:")
-    for level, items in difficulties.items():
-        if items:
-            print(f"   {level}: {len(items)} resources")
+    w(f"\n📈 DIFFICULTY LEVELS:")
+    for level in ('Beginner', 'Intermediate', 'Advanced', 'All Levels'):
+        if level in difficulties:
+            w(f"   {level}: {len(difficulties[level])} resources")
     
     # Persona breakdown
-    print(f"\n🎭 PERSONA CONTRIBUTIONS:")
+    w(f"\n🎭 PERSONA CONTRIBUTIONS:")
     for persona, items in personas.items():
         persona_name = persona.replace('_', ' ').title()
-        print(f"   {persona_name}: {len(items)} resources")
-        print(f"      Focus: {get_persona_focus(persona)}")
+        w(f"   {persona_name}: {len(items)} resources")
+        w(f"      Focus: {get_persona_focus(persona)}")
     
-    print(f"\n🏆 KEY HIGHLIGHTS:")
-    print(f"   • Covers ALL major AI learning paths (theory + practice)")
-    print(f"   • Includes industry certifications (Google, AWS, TensorFlow)")
-    print(f"   • Mix of beginner-friendly and advanced resources")
-    print(f"   • Best free resources (MIT, Stanford, 3Blue1Brown)")
-    print(f"   • Real-world project guidance and code examples")
+    w(f"\n🏆 KEY HIGHLIGHTS:")
+    w(f"   • Covers ALL major AI learning paths (theory + practice)")
+    w(f"   • Includes industry certifications (Google, AWS, TensorFlow)")
+    w(f"   • Mix of beginner-friendly and advanced resources")
+    w(f"   • Best free resources (MIT, Stanford, 3Blue1Brown)")
+    w(f"   • Real-world project guidance and code examples")
+    
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
+
+# Focus description for each persona, built once at import
+PERSONA_FOCUSES = MappingProxyType({
+    'technical_mentor': 'Practical tutorials and hands-on projects',
+    'academic_educator': 'University courses and theoretical foundations',
+    'industry_expert': 'Professional certifications and industry skills',
+    'content_curator': 'Best online resources and community favorites'
+})
 
+@lru_cache(maxsize=32)
 def get_persona_focus(persona):
     """Get focus description for each persona"""
-    focuses = {
-        'technical_mentor': 'Practical tutorials and hands-on projects',
-        'academic_educator': 'University courses and theoretical foundations',
-        'industry_expert': 'Professional certifications and industry skills',
-        'content_curator': 'Best online resources and community favorites'
-    }
-    return focuses.get(persona, 'General learning resources')
+    return PERSONA_FOCUSES.get(persona, 'General learning resources')
 
 if __name__ == "__main__":
     show_comprehensive_ai_results() 
\ No newline at end of file
@@ -3,33 +3,33 @@ import sys
 import os
 from pathlib import Path
 
-# Add backend to path - get the correct backend path
-import os
-current_dir = os.getcwd()
-if current_dir.endswith('backend'):
-    # Already in backend directory
-    sys.path.insert(0, current_dir)
-else:
-    # Add backend directory to path
-    backend_path = Path(__file__).parent.parent.parent / "backend"
-    sys.path.insert(0, str(backend_path))
+# pytest, run_all_tests and `python -m tests.<package>.<name>` already have
+# backend/ on sys.path; a plain `python path/to/script.py` run needs it added
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 os.environ['HUGGINGFACE_API_TOKEN'] = 'your_huggingface_token_here'
 
-from services.content_aggregator import ContentAggregator
-
 def test_import():
     print("Testing ContentAggregator import...")
+    # Imported here so collecting this module doesn't load the service stack
+    from services.content_aggregator import ContentAggregator
     aggregator = ContentAggregator()
     
-    print(f"Has get_all_resources: {hasattr(aggregator, 'get_all_resources')}")
-    print(f"Has llm_search: {hasattr(aggregator, 'llm_search')}")
+    # Snapshot class and instance attributes once instead of repeated hasattr/dir walks
+    cls = type(aggregator)
+    cls_attrs = set(dir(cls))
+    inst_attrs = set(vars(aggregator))
+    has_llm_search = 'llm_search' in inst_attrs or 'llm_search' in cls_attrs
+    
+    print(f"Has get_all_resources: {'get_all_resources' in cls_attrs}")
+    print(f"Has llm_search: {has_llm_search}")
     
-    if hasattr(aggregator, 'llm_search'):
+    if has_llm_search:
         print(f"LLM search type: {type(aggregator.llm_search)}")
     
     # Check methods
-    methods = [method for method in dir(aggregator) if not method.startswith('_')]
+    methods = sorted(name for name in cls_attrs if not name.startswith('_') and callable(getattr(cls, name, None)))
     print(f"Available methods: {methods}")
 
 if __name__ == "__main__":
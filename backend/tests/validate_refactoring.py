@@ -3,38 +3,41 @@
 Final validation script for ContentAggregator refactoring
 """
 import asyncio
+import sys
 
-print('🧪 FINAL VALIDATION TEST - ContentAggregator Refactoring')
-print('='*60)
-
-# Test imports
-try:
-    from services import ContentAggregator, Resource, SearchEngineManager, FallbackDataProvider
-    print('✅ All module imports successful')
-except ImportError as e:
-    print(f'❌ Import failed: {e}')
-    exit(1)
+def check_components():
+    """Import and instantiate every refactored component"""
+    # Test imports
+    try:
+        from services import ContentAggregator, Resource, SearchEngineManager, FallbackDataProvider
+        print('✅ All module imports successful')
+    except ImportError as e:
+        print(f'❌ Import failed: {e}')
+        exit(1)
 
-# Test basic instantiation
-try:
-    agg = ContentAggregator()
-    search_mgr = SearchEngineManager()
-    fallback = FallbackDataProvider()
-    print('✅ All components instantiate correctly')
-except Exception as e:
-    print(f'❌ Instantiation failed: {e}')
-    exit(1)
+    # Test basic instantiation
+    try:
+        agg = ContentAggregator()
+        search_mgr = SearchEngineManager()
+        fallback = FallbackDataProvider()
+        print('✅ All components instantiate correctly')
+    except Exception as e:
+        print(f'❌ Instantiation failed: {e}')
+        exit(1)
 
 # Test basic functionality
 async def test_functionality():
+    # Imported here so loading this module doesn't pull in the service stack
+    from services import ContentAggregator
+    
     try:
         async with ContentAggregator() as aggregator:
-            # Test documentation
-            docs = await aggregator.get_documentation('scala', [])
+            # Documentation and blog lookups are independent, so run them together
+            docs, blogs = await asyncio.gather(
+                aggregator.get_documentation('scala', []),
+                aggregator.get_blogs('python', ['tutorial'])
+            )
             print(f'✅ Documentation test: {len(docs)} resources found')
-            
-            # Test blogs  
-            blogs = await aggregator.get_blogs('python', ['tutorial'])
             print(f'✅ Blog test: {len(blogs)} resources found')
             
             # Test context manager cleanup
@@ -45,21 +48,33 @@ async def test_functionality():
         print(f'❌ Functionality test failed: {e}')
         return False
 
-# Run async test
-success = asyncio.run(test_functionality())
+def main():
+    print('🧪 FINAL VALIDATION TEST - ContentAggregator Refactoring')
+    print('='*60)
+    
+    check_components()
+    
+    # Run async test
+    success = asyncio.run(test_functionality())
+
+    if success:
+        # Emit the summary with a single write
+        sys.stdout.write('\n'.join([
+            '\n🎉 REFACTORING VALIDATION SUCCESSFUL!',
+            '✅ All tests passed',
+            '✅ Modular structure working correctly',
+            '✅ Backward compatibility maintained',
+            '✅ Error handling functioning properly',
+            '✅ Context management working correctly',
+            '\n📋 Summary:',
+            '   • Original 641-line monolithic file → Clean modular structure',
+            '   • 4 new focused modules with clear responsibilities',
+            '   • 100% test coverage with comprehensive test suite',
+            '   • Production-ready codebase following best practices',
+        ]) + '\n')
+    else:
+        print('\n❌ REFACTORING VALIDATION FAILED!')
+        exit(1)
 
-if success:
-    print('\n🎉 REFACTORING VALIDATION SUCCESSFUL!')
-    print('✅ All tests passed')
-    print('✅ Modular structure working correctly') 
-    print('✅ Backward compatibility maintained')
-    print('✅ Error handling functioning properly')
-    print('✅ Context management working correctly')
-    print('\n📋 Summary:')
-    print('   • Original 641-line monolithic file → Clean modular structure')
-    print('   • 4 new focused modules with clear responsibilities')
-    print('   • 100% test coverage with comprehensive test suite')
-    print('   • Production-ready codebase following best practices')
-else:
-    print('\n❌ REFACTORING VALIDATION FAILED!')
-    exit(1) 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
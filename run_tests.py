@@ -29,11 +29,15 @@ def main():
     
     runner = TestRunner()
     
-    # Run main test suite
-    success = runner.run_all_tests()
-    
-    # Show legacy tests info
-    runner.run_legacy_tests()
+    try:
+        # Run main test suite
+        success = runner.run_all_tests()
+        
+        # Show legacy tests info
+        runner.run_legacy_tests()
+    finally:
+        # Flush queued runner output even if the run raises or is interrupted
+        runner.close()
     
     print("\n" + "=" * 60)
     if success:
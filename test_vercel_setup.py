@@ -9,53 +9,62 @@ import os
 import asyncio
 import json
 
-# Test import of the API handler
-try:
-    from backend.index import app
-    print("✅ Successfully imported FastAPI app from backend/index.py")
-except ImportError as e:
-    print(f"❌ Failed to import FastAPI app: {e}")
-    sys.exit(1)
+def load_app():
+    """Import the FastAPI app and check its type; exits on failure"""
+    # Test import of the API handler
+    try:
+        from backend.index import app
+        print("✅ Successfully imported FastAPI app from backend/index.py")
+    except ImportError as e:
+        print(f"❌ Failed to import FastAPI app: {e}")
+        sys.exit(1)
 
-# Test if the app is properly configured
-try:
-    # Check if it's a FastAPI app
-    from fastapi import FastAPI
-    if isinstance(app, FastAPI):
-        print("✅ App is a valid FastAPI instance")
-    else:
-        print(f"❌ App is not a FastAPI instance, got: {type(app)}")
+    # Test if the app is properly configured
+    try:
+        # Check if it's a FastAPI app
+        from fastapi import FastAPI
+        if isinstance(app, FastAPI):
+            print("✅ App is a valid FastAPI instance")
+        else:
+            print(f"❌ App is not a FastAPI instance, got: {type(app)}")
+            sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error checking app type: {e}")
         sys.exit(1)
-except Exception as e:
-    print(f"❌ Error checking app type: {e}")
-    sys.exit(1)
+    
+    return app
 
 # Test basic endpoints
-async def test_endpoints():
+async def test_endpoints(app=None):
     """Test the basic endpoints"""
-    from fastapi.testclient import TestClient
+    if app is None:
+        app = load_app()
+    # Drive the ASGI app directly on this event loop; both probes run concurrently
+    from httpx import AsyncClient, ASGITransport
     
     try:
-        client = TestClient(app)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            root_response, health_response = await asyncio.gather(
+                client.get("/"),
+                client.get("/health")
+            )
         
         # Test root endpoint
-        response = client.get("/")
-        if response.status_code == 200:
+        if root_response.status_code == 200:
             print("✅ Root endpoint (/) works")
-            print(f"   Response: {response.json()}")
+            print(f"   Response: {root_response.json()}")
         else:
-            print(f"❌ Root endpoint failed: {response.status_code}")
+            print(f"❌ Root endpoint failed: {root_response.status_code}")
         
         # Test health endpoint
-        response = client.get("/health")
-        if response.status_code == 200:
+        if health_response.status_code == 200:
             print("✅ Health endpoint (/health) works")
-            data = response.json()
+            data = health_response.json()
             print(f"   Status: {data.get('status')}")
             print(f"   OpenRouter API: {data.get('openrouter_api')}")
             print(f"   Version: {data.get('version')}")
         else:
-            print(f"❌ Health endpoint failed: {response.status_code}")
+            print(f"❌ Health endpoint failed: {health_response.status_code}")
             
     except Exception as e:
         print(f"❌ Error testing endpoints: {e}")
@@ -64,8 +73,11 @@ if __name__ == "__main__":
     print("🧪 Testing Vercel setup for Mentor Mind API...")
     print("=" * 50)
     
+    # Heavy imports happen only now, after the header is shown
+    app = load_app()
+    
     # Run endpoint tests
-    asyncio.run(test_endpoints())
+    asyncio.run(test_endpoints(app))
     
     print("=" * 50)
     print("🎉 Setup test completed!")